@@ -312,6 +312,18 @@ class CompensationPaperScreener:
         if not inverted_index:
             return ""
 
+        # 위치가 0..n-1을 빠짐없이 한 번씩 채우면 정렬 대신 해당 칸에 바로 배치
+        count = sum(len(positions) for positions in inverted_index.values())
+        size = 1 + max((pos for positions in inverted_index.values() for pos in positions), default=-1)
+        if size == count:
+            words = [None] * size
+            for word, positions in inverted_index.items():
+                for pos in positions:
+                    words[pos] = word
+            if None not in words:
+                return " ".join(words)
+
+        # 빈 칸이나 중복 위치가 있으면 정렬해서 모든 단어 유지
         word_positions = []
         for word, positions in inverted_index.items():
             for pos in positions:
@@ -18,8 +18,54 @@ from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import subprocess
 import hashlib
+import sqlite3
 import time
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+
+ARCHIVE_SUFFIXES = ('.tar.zst', '.tar.gz', '.tar')
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize values JSON does not support natively (Path, datetime, ...)"""
+    return str(obj)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        # Datetimes and dataclasses go through _json_default too, matching the json fallback
+        return orjson.dumps(data, default=_json_default, option=(
+            orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        ))
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class BackupManager:
     def __init__(self, config_file: str = "backup_config.json"):
         self.config_file = config_file
@@ -27,12 +73,35 @@ class BackupManager:
         self.setup_logging()
 
         # Backup destinations
-        self.local_backup_dir = Path(self.config.get('local_backup_dir', 'backups'))
+        self.local_backup_dir = Path(self.config.get('local_backup_dir', 'backups')).resolve()
         self.cloud_backup_enabled = self.config.get('cloud_backup_enabled', False)
 
         # Ensure backup directory exists
         self.local_backup_dir.mkdir(parents=True, exist_ok=True)
 
+        # Checksum cache keyed by (path, size, mtime, inode)
+        self.checksum_cache_file = self.local_backup_dir / ".checksum_cache.sqlite"
+        self._checksum_db: Optional[sqlite3.Connection] = None
+
+        # Index of backups so listing does not reopen every metadata sidecar
+        self._index_db = sqlite3.connect(self.local_backup_dir / "backups_index.sqlite")
+        self._index_db.execute(
+            "CREATE TABLE IF NOT EXISTS backups ("
+            "name TEXT PRIMARY KEY, type TEXT, created TEXT, modified TEXT, size INTEGER, "
+            "checksum TEXT, path TEXT, metadata_json TEXT)"
+        )
+        self._index_db.commit()
+        self._index_synced = False
+
+        # Internal integrity hash (sha256 is kept for externally shared checksums)
+        self.hash_algo = self._resolve_hash_algorithm(self.config.get('hash_algorithm', 'blake3'))
+
+        # Archive compression (gzip by default; zstd is opt-in and needs zstd-aware tooling to read)
+        self.compression_codec = self.config.get('compression_codec', 'gzip')
+        if self.compression_codec == 'zstd' and zstd is None:
+            self.logger.warning("zstandard not installed. Falling back to gzip compression.")
+            self.compression_codec = 'gzip'
+
     def setup_logging(self):
         """Setup backup logging"""
         os.makedirs('logs', exist_ok=True)
@@ -53,6 +122,9 @@ class BackupManager:
             "local_backup_dir": "backups",
             "retention_days": 30,
             "compression_enabled": True,
+            "compression_codec": "gzip",
+            "compression_level": 3,
+            "hash_algorithm": "blake3",
             "incremental_backup": True,
             "cloud_backup_enabled": False,
             "cloud_provider": "aws_s3",
@@ -128,7 +200,10 @@ class BackupManager:
             archive_path = self._create_archive(backup_dir, backup_name, backup_info)
 
             # Generate checksum
-            backup_info["checksum"] = self._calculate_checksum(archive_path)
+            backup_info["checksum"] = {
+                "algo": self.hash_algo,
+                "digest": self._calculate_checksum(archive_path)
+            }
 
             # Upload to cloud (if enabled)
             if self.cloud_backup_enabled:
@@ -195,7 +270,10 @@ class BackupManager:
             archive_path = self._create_archive(backup_dir, backup_name, backup_info)
 
             # Generate checksum
-            backup_info["checksum"] = self._calculate_checksum(archive_path)
+            backup_info["checksum"] = {
+                "algo": self.hash_algo,
+                "digest": self._calculate_checksum(archive_path)
+            }
 
             # Upload to cloud (if enabled)
             if self.cloud_backup_enabled:
@@ -325,7 +403,14 @@ class BackupManager:
 
     def _create_archive(self, backup_dir: Path, backup_name: str, backup_info: Dict[str, Any]) -> Path:
         """Create compressed archive of backup"""
-        if self.config.get("compression_enabled", True):
+        if self.config.get("compression_enabled", True) and self.compression_codec == "zstd":
+            archive_path = self.local_backup_dir / f"{backup_name}.tar.zst"
+            cctx = zstd.ZstdCompressor(level=self.config.get("compression_level", 3), threads=-1)
+
+            with open(archive_path, 'wb') as raw, cctx.stream_writer(raw) as writer:
+                with tarfile.open(fileobj=writer, mode='w|') as tar:
+                    tar.add(backup_dir, arcname=backup_name)
+        elif self.config.get("compression_enabled", True):
             archive_path = self.local_backup_dir / f"{backup_name}.tar.gz"
 
             with tarfile.open(archive_path, 'w:gz') as tar:
@@ -337,6 +422,7 @@ class BackupManager:
                 tar.add(backup_dir, arcname=backup_name)
 
         backup_info["compressed"] = self.config.get("compression_enabled", True)
+        backup_info["compression_codec"] = self.compression_codec if backup_info["compressed"] else None
         backup_info["archive_size_bytes"] = os.path.getsize(archive_path)
 
         return archive_path
@@ -365,15 +451,84 @@ class BackupManager:
                 return True
         return False
 
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA256 checksum of file"""
-        sha256_hash = hashlib.sha256()
+    def _open_checksum_cache(self) -> sqlite3.Connection:
+        """Open the checksum cache database (once per manager)"""
+        if self._checksum_db is None:
+            self._checksum_db = sqlite3.connect(self.checksum_cache_file)
+            self._checksum_db.execute(
+                "CREATE TABLE IF NOT EXISTS checksums ("
+                "path TEXT, algo TEXT, size INTEGER, mtime_ns INTEGER, inode INTEGER, digest TEXT, "
+                "PRIMARY KEY (path, algo))"
+            )
+        return self._checksum_db
+
+    def _resolve_hash_algorithm(self, algo: str) -> str:
+        """Fall back to sha256 when the configured hash library is not installed"""
+        if algo == "blake3" and blake3 is None:
+            self.logger.warning("blake3 not installed. Falling back to sha256 checksums.")
+            return "sha256"
+        if algo == "xxh3_128" and xxhash is None:
+            self.logger.warning("xxhash not installed. Falling back to sha256 checksums.")
+            return "sha256"
+        if algo not in ("blake3", "xxh3_128", "sha256"):
+            self.logger.warning(f"Unsupported hash algorithm: {algo}. Using sha256.")
+            return "sha256"
+        return algo
+
+    def _new_hasher(self, algo: str):
+        """Create a hash object for the given algorithm"""
+        if algo == "blake3":
+            if blake3 is None:
+                raise ImportError("blake3 not installed")
+            return blake3.blake3()
+        if algo == "xxh3_128":
+            if xxhash is None:
+                raise ImportError("xxhash not installed")
+            return xxhash.xxh3_128()
+        if algo == "sha256":
+            return hashlib.sha256()
+        raise ValueError(f"Unsupported hash algorithm: {algo}")
+
+    def _calculate_checksum(self, file_path: Path, algo: Optional[str] = None) -> str:
+        """Calculate checksum of file, reusing the cached digest if unchanged"""
+        algo = algo or self.hash_algo
+        st = Path(file_path).stat()
+        key = str(Path(file_path).resolve())
+
+        try:
+            with self._open_checksum_cache() as conn:
+                row = conn.execute(
+                    "SELECT digest FROM checksums "
+                    "WHERE path = ? AND algo = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+                    (key, algo, st.st_size, st.st_mtime_ns, st.st_ino)
+                ).fetchone()
+            if row:
+                return row[0]
+        except sqlite3.Error as e:
+            self.logger.warning(f"Checksum cache unavailable: {e}")
+
+        digest = self._hash_file(file_path, algo)
+
+        try:
+            with self._open_checksum_cache() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, algo, st.st_size, st.st_mtime_ns, st.st_ino, digest)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to update checksum cache: {e}")
+
+        return digest
+
+    def _hash_file(self, file_path: Path, algo: str) -> str:
+        """Hash file contents with the given algorithm"""
+        hasher = self._new_hasher(algo)
 
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
 
-        return sha256_hash.hexdigest()
+        return hasher.hexdigest()
 
     def _upload_to_cloud(self, archive_path: Path, backup_info: Dict[str, Any]):
         """Upload backup to cloud storage"""
@@ -468,7 +623,15 @@ class BackupManager:
         """Extract backup archive"""
         files_restored = 0
 
-        if backup_file.suffix == '.gz':
+        if backup_file.name.endswith('.tar.zst'):
+            if zstd is None:
+                raise ImportError("zstandard not installed. Cannot extract .tar.zst backups.")
+
+            with open(backup_file, 'rb') as raw, zstd.ZstdDecompressor().stream_reader(raw) as reader:
+                with tarfile.open(fileobj=reader, mode='r|') as tar:
+                    tar.extractall(restore_path)
+                    files_restored = len(tar.getnames())
+        elif backup_file.suffix == '.gz':
             with tarfile.open(backup_file, 'r:gz') as tar:
                 tar.extractall(restore_path)
                 files_restored = len(tar.getnames())
@@ -491,22 +654,25 @@ class BackupManager:
             "deleted_backups": []
         }
 
-        for backup_file in self.local_backup_dir.glob("*.tar*"):
-            try:
-                file_mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
+        with self._index_db:
+            for entry in self._scan_archives():
+                try:
+                    stat = entry.stat()
 
-                if file_mtime < cutoff_date:
-                    file_size = backup_file.stat().st_size
-                    backup_file.unlink()
+                    if datetime.fromtimestamp(stat.st_mtime) < cutoff_date:
+                        os.unlink(entry.path)
+                        self._index_db.execute(
+                            "DELETE FROM backups WHERE name = ?", (self._backup_name(Path(entry.path)),)
+                        )
 
-                    cleanup_info["files_deleted"] += 1
-                    cleanup_info["space_freed_bytes"] += file_size
-                    cleanup_info["deleted_backups"].append(backup_file.name)
+                        cleanup_info["files_deleted"] += 1
+                        cleanup_info["space_freed_bytes"] += stat.st_size
+                        cleanup_info["deleted_backups"].append(entry.name)
 
-                    self.logger.info(f"Deleted old backup: {backup_file.name}")
+                        self.logger.info(f"Deleted old backup: {entry.name}")
 
-            except Exception as e:
-                self.logger.error(f"Failed to delete backup {backup_file}: {e}")
+                except Exception as e:
+                    self.logger.error(f"Failed to delete backup {entry.path}: {e}")
 
         return cleanup_info
 
@@ -514,47 +680,116 @@ class BackupManager:
         """List all available backups"""
         backups = []
 
-        # List local backups
-        for backup_file in sorted(self.local_backup_dir.glob("*.tar*")):
+        # Writes and cleanup keep the index current; reconcile with the directory once per run
+        if not self._index_synced:
+            self._sync_backup_index()
+            self._index_synced = True
+
+        rows = self._index_db.execute(
+            "SELECT name, type, created, modified, size, path, metadata_json "
+            "FROM backups ORDER BY created DESC"
+        ).fetchall()
+
+        for name, backup_type, created, modified, size, path, metadata_json in rows:
             try:
-                stat = backup_file.stat()
                 backup_info = {
-                    "name": backup_file.stem,
-                    "file_path": str(backup_file),
-                    "size_bytes": stat.st_size,
-                    "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "type": "incremental" if "incremental" in backup_file.name else "full"
+                    "name": name,
+                    "file_path": str(self.local_backup_dir / Path(path).name),
+                    "size_bytes": size,
+                    "size_mb": round(size / (1024 * 1024), 2),
+                    "created": created,
+                    "modified": modified,
+                    "type": backup_type
                 }
 
-                # Try to load metadata
-                metadata = self._load_backup_metadata(backup_file.stem)
-                if metadata:
-                    backup_info.update(metadata)
+                if metadata_json:
+                    backup_info.update(loads_json(metadata_json))
 
                 backups.append(backup_info)
 
             except Exception as e:
-                self.logger.error(f"Error processing backup {backup_file}: {e}")
+                self.logger.error(f"Error processing backup {name}: {e}")
 
         return backups
 
+    def _scan_archives(self) -> List[os.DirEntry]:
+        """List backup archives with a single directory read (entries cache their stat)"""
+        with os.scandir(self.local_backup_dir) as it:
+            return [entry for entry in it if entry.name.endswith(ARCHIVE_SUFFIXES) and entry.is_file()]
+
+    def _backup_name(self, backup_file: Path) -> str:
+        """Strip archive suffixes from a backup file name"""
+        for suffix in ARCHIVE_SUFFIXES:
+            if backup_file.name.endswith(suffix):
+                return backup_file.name[:-len(suffix)]
+        return backup_file.stem
+
+    def _index_backup(self, backup_file: Path, metadata: Optional[Dict[str, Any]]):
+        """Insert or refresh a backup row in the index"""
+        stat = backup_file.stat()
+        name = self._backup_name(backup_file)
+        checksum = metadata.get("checksum") if metadata else None
+
+        with self._index_db:
+            self._index_db.execute(
+                "INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    name,
+                    "incremental" if "incremental" in backup_file.name else "full",
+                    datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                    datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    stat.st_size,
+                    dumps_json(checksum).decode('utf-8') if checksum else None,
+                    backup_file.name,
+                    dumps_json(metadata).decode('utf-8') if metadata else None
+                )
+            )
+
+    def _sync_backup_index(self):
+        """Index archives created outside this manager and drop rows for removed ones"""
+        on_disk = {self._backup_name(Path(e.path)): Path(e.path) for e in self._scan_archives()}
+        indexed = {row[0] for row in self._index_db.execute("SELECT name FROM backups")}
+
+        for name in on_disk.keys() - indexed:
+            try:
+                self._index_backup(on_disk[name], self._load_metadata_sidecar(name))
+            except Exception as e:
+                self.logger.error(f"Error indexing backup {on_disk[name]}: {e}")
+
+        stale = indexed - on_disk.keys()
+        if stale:
+            with self._index_db:
+                self._index_db.executemany("DELETE FROM backups WHERE name = ?", [(name,) for name in stale])
+
     def _save_backup_metadata(self, backup_info: Dict[str, Any]):
         """Save backup metadata"""
         metadata_file = self.local_backup_dir / f"{backup_info['backup_name']}.metadata.json"
 
-        with open(metadata_file, 'w') as f:
-            json.dump(backup_info, f, indent=2, default=str)
+        with open(metadata_file, 'wb') as f:
+            f.write(dumps_json(backup_info))
+
+        if backup_info.get("backup_path"):
+            self._index_backup(Path(backup_info["backup_path"]), backup_info)
 
     def _load_backup_metadata(self, backup_name: str) -> Optional[Dict[str, Any]]:
         """Load backup metadata"""
+        row = self._index_db.execute(
+            "SELECT metadata_json FROM backups WHERE name = ?", (backup_name,)
+        ).fetchone()
+
+        if row and row[0]:
+            return loads_json(row[0])
+
+        return self._load_metadata_sidecar(backup_name)
+
+    def _load_metadata_sidecar(self, backup_name: str) -> Optional[Dict[str, Any]]:
+        """Load backup metadata from its JSON sidecar file"""
         metadata_file = self.local_backup_dir / f"{backup_name}.metadata.json"
 
         if metadata_file.exists():
             try:
-                with open(metadata_file, 'r') as f:
-                    return json.load(f)
+                with open(metadata_file, 'rb') as f:
+                    return loads_json(f.read())
             except Exception as e:
                 self.logger.error(f"Failed to load metadata for {backup_name}: {e}")
 
@@ -562,21 +797,32 @@ class BackupManager:
 
     def _find_backup_file(self, backup_name: str) -> Optional[Path]:
         """Find backup file by name"""
-        for backup_file in self.local_backup_dir.glob(f"{backup_name}.*"):
-            if backup_file.suffix in ['.tar', '.gz'] and backup_file.is_file():
+        for suffix in ARCHIVE_SUFFIXES:
+            backup_file = self.local_backup_dir / f"{backup_name}{suffix}"
+            if backup_file.is_file():
                 return backup_file
         return None
 
     def _verify_backup_integrity(self, backup_file: Path) -> bool:
         """Verify backup file integrity"""
-        metadata = self._load_backup_metadata(backup_file.stem)
+        metadata = self._load_backup_metadata(self._backup_name(backup_file))
 
         if not metadata or 'checksum' not in metadata:
             self.logger.warning(f"No checksum available for {backup_file.name}")
             return True  # Assume OK if no checksum
 
-        calculated_checksum = self._calculate_checksum(backup_file)
-        stored_checksum = metadata['checksum']
+        stored = metadata['checksum']
+        if isinstance(stored, dict):
+            algo, stored_checksum = stored.get('algo', 'sha256'), stored.get('digest')
+        else:
+            # Legacy metadata stored a bare SHA256 hex digest
+            algo, stored_checksum = 'sha256', stored
+
+        try:
+            calculated_checksum = self._calculate_checksum(backup_file, algo)
+        except (ImportError, ValueError) as e:
+            self.logger.error(f"Cannot verify {backup_file.name}: {e}")
+            return False
 
         if calculated_checksum == stored_checksum:
             self.logger.info(f"Backup integrity verified: {backup_file.name}")
@@ -632,17 +878,17 @@ def main():
     if command == "full-backup":
         backup_name = sys.argv[2] if len(sys.argv) > 2 else None
         result = manager.create_full_backup(backup_name)
-        print(json.dumps(result, indent=2, default=str))
+        print(dumps_json(result).decode('utf-8'))
 
     elif command == "incremental-backup":
         result = manager.create_incremental_backup()
-        print(json.dumps(result, indent=2, default=str))
+        print(dumps_json(result).decode('utf-8'))
 
     elif command == "restore" and len(sys.argv) > 2:
         backup_name = sys.argv[2]
         restore_path = sys.argv[3] if len(sys.argv) > 3 else None
         result = manager.restore_backup(backup_name, restore_path)
-        print(json.dumps(result, indent=2, default=str))
+        print(dumps_json(result).decode('utf-8'))
 
     elif command == "list":
         backups = manager.list_backups()
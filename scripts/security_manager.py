@@ -6,26 +6,213 @@ Comprehensive security management and monitoring system
 """
 
 import os
+import re
+import stat
 import sys
+import atexit
+import mmap
 import json
-import hashlib
 import secrets
 import logging
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import base64
-from cryptography.fernet import Fernet
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# AES-GCM nonce size in bytes; every ciphertext is stored as nonce + ciphertext
+NONCE_SIZE = 12
+
+# Secrets file layout version; values inside are plaintext and only the whole file is encrypted
+SECRETS_FORMAT = 2
+
+# Basic API key validation rules by service
+_VALIDATORS = {
+    'openai': lambda k: k.startswith('sk-') and len(k) > 40,
+    'github': lambda k: k.startswith(('ghp_', 'gho_')),
+    'slack': lambda k: k.startswith('xox'),
+    'discord': lambda k: 'discord.com' in k or len(k) > 50
+}
+
+# Keys for unknown services must be printable ASCII
+_PRINTABLE_KEY_RE = re.compile(r'[\x20-\x7e]+')
+
+# PBKDF2-HMAC-SHA256 parameters for hash_sensitive_data
+PBKDF2_ITERATIONS = 100000
+PBKDF2_LENGTH = 32
+
+# OS-backed RNG shared by password generation
+_SYSTEM_RANDOM = secrets.SystemRandom()
+
+# Buffered last-accessed times are written once this many are pending or this many seconds pass
+ACCESS_FLUSH_MAX_PENDING = 32
+ACCESS_FLUSH_INTERVAL = 60.0
+
+# Audit entries are buffered and flushed every AUDIT_FLUSH_EVERY events, or
+# immediately for events that must not be lost
+AUDIT_FLUSH_EVERY = 16
+CRITICAL_AUDIT_EVENTS = frozenset({
+    'ENCRYPTION_KEY_ROTATED',
+    'SECRET_LEAK_DETECTED',
+    'INSECURE_FILE_PERMISSIONS',
+    'API_KEY_VALIDATION_FAILED'
+})
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data as compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_private(path: Path, data: bytes):
+    """Write data to path, creating it owner-only (0600) in the same call"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+
+
+# Patterns that indicate a secret committed to the codebase, by category
+SECRET_PATTERNS = {
+    'api_keys': [
+        r'api[_-]?key[_-]?=\s*["\']([^"\']+)["\']',
+        r'key[_-]?=\s*["\']([a-zA-Z0-9_-]{20,})["\']'
+    ],
+    'tokens': [
+        r'token[_-]?=\s*["\']([^"\']+)["\']',
+        r'auth[_-]?token[_-]?=\s*["\']([^"\']+)["\']'
+    ],
+    'passwords': [
+        r'password[_-]?=\s*["\']([^"\']+)["\']',
+        r'passwd[_-]?=\s*["\']([^"\']+)["\']'
+    ],
+    'github_tokens': [
+        r'ghp_[a-zA-Z0-9]{36}',
+        r'gho_[a-zA-Z0-9]{36}'
+    ],
+    'slack_tokens': [
+        r'xox[baprs]-[a-zA-Z0-9-]+'
+    ]
+}
+
+
+def _compile_secret_patterns(patterns: Dict[str, List[str]]) -> List[Tuple[str, re.Pattern, Dict[str, int]]]:
+    """Fuse each category's patterns into one bytes regex, mapping each alternative to its reported group"""
+    compiled = []
+    for category, category_patterns in patterns.items():
+        alternatives = []
+        groups = {}
+        index = 0
+        for i, pattern in enumerate(category_patterns):
+            name = f'{category}_{i}'
+            inner_groups = re.compile(pattern).groups
+            alternatives.append(f'(?P<{name}>{pattern})')
+            groups[name] = index + 2 if inner_groups else index + 1
+            index += 1 + inner_groups
+        compiled.append((category, re.compile('|'.join(alternatives).encode(), re.IGNORECASE), groups))
+    return compiled
+
+
+# One regex per category, so a match in one category never hides a match in another
+_SECRET_RES = _compile_secret_patterns(SECRET_PATTERNS)
+
+# File types scanned for leaked secrets
+SCAN_EXTENSIONS = frozenset({'.py', '.yml', '.yaml', '.json', '.env', '.txt'})
+
+# Larger files are skipped by the leak scan; they are data dumps, not source
+MAX_SCAN_FILE_SIZE = 50 * 1024 * 1024
+
+# Bumped when the scanner's matching changes, so cached findings from an older scanner are not reused
+SCAN_CACHE_VERSION = 2
+
+# Below this many files the leak scan runs inline; starting worker processes costs more
+PARALLEL_SCAN_MIN_FILES = 64
+
+
+def _iter_scan_files(path: str):
+    """Yield scannable files under path, skipping .git* and __pycache__ directories"""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith('.git') and name != '__pycache__':
+                        yield from _iter_scan_files(entry.path)
+                elif entry.is_file():
+                    dot = name.rfind('.')
+                    if dot >= 0 and name[dot:] in SCAN_EXTENSIONS:
+                        yield entry.path
+    except OSError:
+        return
+
+
+def _scan_one(file_path: str) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """Scan one file for leaked secrets, returning (category, value) hits and any error"""
+    hits = []
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or size > MAX_SCAN_FILE_SIZE:
+                return hits, None
+
+            # Match straight against the page cache, without reading or decoding
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for category, regex, groups in _SECRET_RES:
+                    for match in regex.finditer(content):
+                        hits.append((category, match.group(groups[match.lastgroup]).decode('utf-8', errors='ignore')))
+    except Exception as e:
+        return hits, str(e)
+
+    return hits, None
+
 class SecurityManager:
     def __init__(self):
         self.setup_logging()
         self.secrets_file = Path('.secrets.enc')
         self.key_file = Path('.encryption.key')
         self.audit_log = Path('logs/security_audit.log')
-        self.fernet = self._initialize_encryption()
+        self.scan_cache_file = Path('.scan_cache.json')
+        self.aead = self._initialize_encryption()
+
+        # New files are created owner-only; tighten a pre-existing secrets file once here
+        try:
+            os.chmod(self.secrets_file, 0o600)
+        except FileNotFoundError:
+            pass
+
+        # One buffered handle for the audit log instead of an open/close per event
+        self._audit_fp = open(self.audit_log, 'ab', buffering=64 * 1024)
+        self._audit_unflushed = 0
+        atexit.register(self._audit_fp.close)
+
+        # Access times are kept in memory and written with the next save or at exit
+        self._pending_access: Dict[str, str] = {}
+        self._last_flush = time.monotonic()
+        atexit.register(self._flush_pending_access)
+
+        # Decrypted secrets, valid while the file's mtime is unchanged
+        self._secrets_cache: Optional[Dict[str, Any]] = None
+        self._secrets_mtime = 0
 
     def setup_logging(self):
         """Setup security logging"""
@@ -41,26 +228,58 @@ class SecurityManager:
         )
         self.logger = logging.getLogger(__name__)
 
-    def _initialize_encryption(self) -> Fernet:
+    def _initialize_encryption(self) -> AESGCM:
         """Initialize encryption system"""
         if self.key_file.exists():
             # Load existing key
             key = self.key_file.read_bytes()
         else:
             # Generate new key
-            key = Fernet.generate_key()
-            self.key_file.write_bytes(key)
-            os.chmod(self.key_file, 0o600)  # Restrict permissions
+            key = AESGCM.generate_key(bit_length=256)
+            _write_private(self.key_file, key)
             self.logger.info("Generated new encryption key")
 
-        return Fernet(key)
+        return self._aead_from_key(key)
+
+    def _aead_from_key(self, key: bytes) -> AESGCM:
+        """Build the AES-GCM cipher, deriving its key from a legacy Fernet key if needed"""
+        if len(key) == 32:
+            self.legacy_fernet = None
+            return AESGCM(key)
+
+        # Fernet keys from older installs are kept to read data written before the switch
+        self.legacy_fernet = Fernet(key)
+        derived = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'compensation-research secrets'
+        ).derive(base64.urlsafe_b64decode(key))
+        return AESGCM(derived)
+
+    def _encrypt_bytes(self, data: bytes, aead: Optional[AESGCM] = None) -> bytes:
+        """Encrypt bytes as nonce + AES-GCM ciphertext (with the current cipher unless one is given)"""
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + (aead or self.aead).encrypt(nonce, data, None)
+
+    def _decrypt_bytes(self, blob: bytes) -> bytes:
+        """Decrypt nonce + AES-GCM ciphertext, falling back to legacy Fernet tokens"""
+        try:
+            return self.aead.decrypt(blob[:NONCE_SIZE], blob[NONCE_SIZE:], None)
+        except InvalidTag:
+            if self.legacy_fernet is None:
+                raise
+            try:
+                return self.legacy_fernet.decrypt(blob)
+            except InvalidToken:
+                raise InvalidTag()
 
     def encrypt_secret(self, value: str) -> str:
         """Encrypt a secret value"""
         if not value:
             return ""
 
-        encrypted = self.fernet.encrypt(value.encode())
+        encrypted = self._encrypt_bytes(value.encode())
         return base64.b64encode(encrypted).decode()
 
     def decrypt_secret(self, encrypted_value: str) -> str:
@@ -70,7 +289,7 @@ class SecurityManager:
 
         try:
             encrypted_bytes = base64.b64decode(encrypted_value.encode())
-            decrypted = self.fernet.decrypt(encrypted_bytes)
+            decrypted = self._decrypt_bytes(encrypted_bytes)
             return decrypted.decode()
         except Exception as e:
             self.logger.error(f"Failed to decrypt secret: {e}")
@@ -82,19 +301,16 @@ class SecurityManager:
             # Load existing secrets
             secrets_data = self.load_secrets()
 
-            # Encrypt and store
-            encrypted_value = self.encrypt_secret(value)
+            now = datetime.utcnow().isoformat()
             secrets_data[key] = {
-                'value': encrypted_value,
-                'created': datetime.utcnow().isoformat(),
-                'last_accessed': datetime.utcnow().isoformat()
+                'value': value,
+                'created': now,
+                'last_accessed': now
             }
+            self._pending_access.pop(key, None)
 
             # Save to encrypted file
-            secrets_json = json.dumps(secrets_data, indent=2)
-            encrypted_content = self.fernet.encrypt(secrets_json.encode())
-            self.secrets_file.write_bytes(encrypted_content)
-            os.chmod(self.secrets_file, 0o600)
+            self._save_secrets(secrets_data)
 
             self.audit_log_event('SECRET_STORED', {'key': key})
             self.logger.info(f"Secret stored: {key}")
@@ -112,15 +328,14 @@ class SecurityManager:
             if key not in secrets_data:
                 return None
 
-            # Update last accessed time
-            secrets_data[key]['last_accessed'] = datetime.utcnow().isoformat()
-            self._save_secrets(secrets_data)
-
-            encrypted_value = secrets_data[key]['value']
-            decrypted_value = self.decrypt_secret(encrypted_value)
+            # Record the access; the file is rewritten on the next save or at exit
+            self._pending_access[key] = datetime.utcnow().isoformat()
+            if (len(self._pending_access) >= ACCESS_FLUSH_MAX_PENDING
+                    or time.monotonic() - self._last_flush >= ACCESS_FLUSH_INTERVAL):
+                self._flush_pending_access()
 
             self.audit_log_event('SECRET_ACCESSED', {'key': key})
-            return decrypted_value
+            return secrets_data[key]['value']
 
         except Exception as e:
             self.logger.error(f"Failed to retrieve secret {key}: {e}")
@@ -128,22 +343,65 @@ class SecurityManager:
 
     def load_secrets(self) -> Dict[str, Any]:
         """Load secrets from encrypted file"""
-        if not self.secrets_file.exists():
+        try:
+            mtime = self.secrets_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return {}
 
+        if self._secrets_cache is not None and mtime == self._secrets_mtime:
+            return self._secrets_cache
+
         try:
             encrypted_content = self.secrets_file.read_bytes()
-            decrypted_content = self.fernet.decrypt(encrypted_content)
-            return json.loads(decrypted_content.decode())
+            decrypted_content = self._decrypt_bytes(encrypted_content)
+            data = loads_json(decrypted_content)
+
+            if data.get('format') == SECRETS_FORMAT:
+                secrets_data = data['secrets']
+            else:
+                # Older files encrypt each value individually
+                secrets_data = {
+                    key: {**entry, 'value': self.decrypt_secret(entry['value'])}
+                    for key, entry in data.items()
+                }
         except Exception as e:
             self.logger.error(f"Failed to load secrets: {e}")
             return {}
 
+        self._secrets_cache = secrets_data
+        self._secrets_mtime = mtime
+        return secrets_data
+
+    def _secrets_payload(self, secrets_data: Dict[str, Any]) -> bytes:
+        """Serialize secrets for encryption, applying buffered last-accessed times"""
+        for key, accessed in self._pending_access.items():
+            if key in secrets_data:
+                secrets_data[key]['last_accessed'] = accessed
+        self._pending_access.clear()
+        self._last_flush = time.monotonic()
+
+        # The file is encrypted and never read by people, so it is stored compact
+        return dumps_json({'format': SECRETS_FORMAT, 'secrets': secrets_data})
+
     def _save_secrets(self, secrets_data: Dict[str, Any]):
         """Save secrets to encrypted file"""
-        secrets_json = json.dumps(secrets_data, indent=2)
-        encrypted_content = self.fernet.encrypt(secrets_json.encode())
-        self.secrets_file.write_bytes(encrypted_content)
+        encrypted_content = self._encrypt_bytes(self._secrets_payload(secrets_data))
+
+        # Drop the cache first so a failed write never leaves it ahead of the file
+        self._secrets_cache = None
+        _write_private(self.secrets_file, encrypted_content)
+        self._secrets_cache = secrets_data
+        self._secrets_mtime = self.secrets_file.stat().st_mtime_ns
+
+    def _flush_pending_access(self):
+        """Write buffered last-accessed times to the secrets file"""
+        if not self._pending_access:
+            return
+
+        try:
+            self._save_secrets(self.load_secrets())
+        except Exception as e:
+            self.logger.error(f"Failed to save secret access times: {e}")
 
     def list_secrets(self) -> List[str]:
         """List all stored secret keys (not values)"""
@@ -172,46 +430,40 @@ class SecurityManager:
     def rotate_encryption_key(self) -> bool:
         """Rotate the encryption key and re-encrypt all secrets"""
         try:
-            # Load current secrets
+            # Decrypt the secrets file once with the current key; only the outer
+            # blob is encrypted, so rotating is one decrypt and one encrypt
             current_secrets = self.load_secrets()
-
-            # Decrypt all current values
-            decrypted_data = {}
-            for key, data in current_secrets.items():
-                decrypted_value = self.decrypt_secret(data['value'])
-                decrypted_data[key] = {
-                    'value': decrypted_value,
-                    'created': data['created'],
-                    'last_accessed': data['last_accessed']
-                }
+            if self._secrets_cache is None and self.secrets_file.exists():
+                # Saving now would replace the unreadable file with an empty one
+                raise RuntimeError("secrets file could not be decrypted with the current key")
 
             # Generate new encryption key
-            new_key = Fernet.generate_key()
-            new_fernet = Fernet(new_key)
-
-            # Re-encrypt all secrets with new key
-            new_secrets = {}
-            for key, data in decrypted_data.items():
-                encrypted_value = base64.b64encode(
-                    new_fernet.encrypt(data['value'].encode())
-                ).decode()
-                new_secrets[key] = {
-                    'value': encrypted_value,
-                    'created': data['created'],
-                    'last_accessed': data['last_accessed']
-                }
-
-            # Backup old key
-            backup_key_file = Path(f'.encryption.key.backup.{int(datetime.utcnow().timestamp())}')
-            self.key_file.rename(backup_key_file)
-            os.chmod(backup_key_file, 0o600)
-
-            # Save new key and secrets
-            self.key_file.write_bytes(new_key)
-            os.chmod(self.key_file, 0o600)
-
-            self.fernet = new_fernet
-            self._save_secrets(new_secrets)
+            new_key = AESGCM.generate_key(bit_length=256)
+
+            # Stage the re-encrypted secrets and the new key beside the live files, so a
+            # failure here leaves the old key and secrets untouched
+            tmp_secrets = self.secrets_file.with_name(self.secrets_file.name + '.tmp')
+            tmp_key = self.key_file.with_name(self.key_file.name + '.tmp')
+            try:
+                _write_private(tmp_secrets, self._encrypt_bytes(self._secrets_payload(current_secrets), AESGCM(new_key)))
+                _write_private(tmp_key, new_key)
+
+                # Backup old key
+                backup_key_file = Path(f'.encryption.key.backup.{int(datetime.utcnow().timestamp())}')
+                _write_private(backup_key_file, self.key_file.read_bytes())
+            except Exception:
+                tmp_secrets.unlink(missing_ok=True)
+                tmp_key.unlink(missing_ok=True)
+                raise
+
+            # Swap the secrets in first; if interrupted before the key follows, the new key is still in tmp_key
+            self._secrets_cache = None
+            os.replace(tmp_secrets, self.secrets_file)
+            os.replace(tmp_key, self.key_file)
+
+            self.aead = self._aead_from_key(new_key)
+            self._secrets_cache = current_secrets
+            self._secrets_mtime = self.secrets_file.stat().st_mtime_ns
 
             self.audit_log_event('ENCRYPTION_KEY_ROTATED', {})
             self.logger.info("Encryption key rotated successfully")
@@ -223,8 +475,6 @@ class SecurityManager:
 
     def audit_log_event(self, event_type: str, details: Dict[str, Any]):
         """Log security events for auditing"""
-        os.makedirs('logs', exist_ok=True)
-
         audit_entry = {
             'timestamp': datetime.utcnow().isoformat(),
             'event_type': event_type,
@@ -233,24 +483,21 @@ class SecurityManager:
             'process_id': os.getpid()
         }
 
-        with open(self.audit_log, 'a') as f:
-            f.write(json.dumps(audit_entry) + '\n')
+        self._audit_fp.write(dumps_json(audit_entry) + b'\n')
+        self._audit_unflushed += 1
+
+        if self._audit_unflushed >= AUDIT_FLUSH_EVERY or event_type in CRITICAL_AUDIT_EVENTS:
+            self._audit_fp.flush()
+            self._audit_unflushed = 0
 
     def validate_api_key(self, api_key: str, service: str) -> bool:
         """Validate API key format and basic security"""
         if not api_key:
             return False
 
-        # Basic validation rules
-        validations = {
-            'openai': lambda k: k.startswith('sk-') and len(k) > 40,
-            'github': lambda k: k.startswith('ghp_') or k.startswith('gho_'),
-            'slack': lambda k: k.startswith('xox'),
-            'discord': lambda k: 'discord.com' in k or len(k) > 50
-        }
-
-        if service.lower() in validations:
-            is_valid = validations[service.lower()](api_key)
+        validator = _VALIDATORS.get(service.lower())
+        if validator is not None:
+            is_valid = validator(api_key)
 
             if is_valid:
                 self.audit_log_event('API_KEY_VALIDATED', {'service': service, 'status': 'valid'})
@@ -260,72 +507,86 @@ class SecurityManager:
             return is_valid
 
         # Generic validation for unknown services
-        return len(api_key) >= 16 and api_key.isprintable()
+        return len(api_key) >= 16 and _PRINTABLE_KEY_RE.fullmatch(api_key) is not None
 
     def scan_for_leaked_secrets(self) -> Dict[str, List[str]]:
         """Scan codebase for potential secret leaks"""
-        secret_patterns = {
-            'api_keys': [
-                r'api[_-]?key[_-]?=\s*["\']([^"\']+)["\']',
-                r'key[_-]?=\s*["\']([a-zA-Z0-9_-]{20,})["\']'
-            ],
-            'tokens': [
-                r'token[_-]?=\s*["\']([^"\']+)["\']',
-                r'auth[_-]?token[_-]?=\s*["\']([^"\']+)["\']'
-            ],
-            'passwords': [
-                r'password[_-]?=\s*["\']([^"\']+)["\']',
-                r'passwd[_-]?=\s*["\']([^"\']+)["\']'
-            ],
-            'github_tokens': [
-                r'ghp_[a-zA-Z0-9]{36}',
-                r'gho_[a-zA-Z0-9]{36}'
-            ],
-            'slack_tokens': [
-                r'xox[baprs]-[a-zA-Z0-9-]+'
-            ]
-        }
-
-        findings = {}
         scan_paths = ['.', 'scripts/', 'logs/']
 
-        import re
-
+        # The scan roots overlap, so collect each file once
+        candidates = {}
         for path in scan_paths:
             if not os.path.exists(path):
                 continue
 
-            for root, dirs, files in os.walk(path):
-                # Skip sensitive directories
-                dirs[:] = [d for d in dirs if not d.startswith('.git') and d != '__pycache__']
+            for file_path in _iter_scan_files(path):
+                candidates.setdefault(os.path.normpath(file_path), file_path)
+        candidates.pop(str(self.scan_cache_file), None)
+        file_paths = list(candidates.values())
+
+        # Reuse the previous findings when no scanned file was added, removed or modified
+        fingerprint = self._scan_fingerprint(file_paths)
+        cached = self._load_scan_cache()
+        if fingerprint is not None and cached.get('fingerprint') == fingerprint:
+            findings = cached['findings']
+        else:
+            findings = self._scan_files(file_paths)
+            if fingerprint is not None:
+                try:
+                    _write_private(self.scan_cache_file, dumps_json({
+                        'fingerprint': fingerprint,
+                        'findings': findings
+                    }))
+                except OSError as e:
+                    self.logger.warning(f"Could not write leak scan cache: {e}")
 
-                for file in files:
-                    if file.endswith(('.py', '.yml', '.yaml', '.json', '.env', '.txt')):
-                        file_path = os.path.join(root, file)
+        if findings:
+            self.audit_log_event('SECRET_LEAK_DETECTED', {'findings_count': len(findings)})
 
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
+        return findings
 
-                            for category, patterns in secret_patterns.items():
-                                for pattern in patterns:
-                                    matches = re.findall(pattern, content, re.IGNORECASE)
-                                    if matches:
-                                        if category not in findings:
-                                            findings[category] = []
-                                        findings[category].extend([
-                                            f"{file_path}: {match[:10]}..."
-                                            for match in matches
-                                        ])
+    def _scan_files(self, file_paths: List[str]) -> Dict[str, List[str]]:
+        """Run the leak scan over file_paths, in worker processes for larger trees"""
+        findings = {}
 
-                        except Exception as e:
-                            self.logger.warning(f"Could not scan file {file_path}: {e}")
+        results = None
+        if len(file_paths) >= PARALLEL_SCAN_MIN_FILES:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(_scan_one, file_paths, chunksize=32))
+            except OSError as e:
+                self.logger.warning(f"Parallel leak scan unavailable, scanning serially: {e}")
+        if results is None:
+            results = map(_scan_one, file_paths)
 
-        if findings:
-            self.audit_log_event('SECRET_LEAK_DETECTED', {'findings_count': len(findings)})
+        for file_path, (hits, error) in zip(file_paths, results):
+            if error:
+                self.logger.warning(f"Could not scan file {file_path}: {error}")
+
+            for category, value in hits:
+                findings.setdefault(category, []).append(f"{file_path}: {value[:10]}...")
 
         return findings
 
+    def _scan_fingerprint(self, file_paths: List[str]) -> Optional[str]:
+        """Fingerprint every scanned file by path, size, mtime, ctime and inode"""
+        digest = hashlib.sha256(f"v{SCAN_CACHE_VERSION}\n".encode())
+        try:
+            for path in file_paths:
+                st = os.stat(path)
+                digest.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ctime_ns}\0{st.st_ino}\n".encode())
+        except OSError:
+            return None
+
+        return digest.hexdigest()
+
+    def _load_scan_cache(self) -> Dict[str, Any]:
+        """Load cached leak scan results, or an empty dict if there are none"""
+        try:
+            return loads_json(self.scan_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
     def check_file_permissions(self) -> Dict[str, Any]:
         """Check file permissions for security"""
         sensitive_files = [
@@ -336,50 +597,64 @@ class SecurityManager:
         results = {}
 
         for file_path in sensitive_files:
-            if os.path.exists(file_path):
-                stat_info = os.stat(file_path)
-                permissions = oct(stat_info.st_mode)[-3:]
-
-                # Check if file is readable by others
-                is_secure = not (int(permissions[1]) > 0 or int(permissions[2]) > 0)
-
-                results[file_path] = {
-                    'permissions': permissions,
-                    'is_secure': is_secure,
-                    'owner_readable': int(permissions[0]) >= 4,
-                    'owner_writable': int(permissions[0]) >= 6
-                }
+            try:
+                mode = os.stat(file_path).st_mode
+            except FileNotFoundError:
+                continue
+
+            permissions = f'{mode & 0o777:03o}'
 
-                if not is_secure:
-                    self.audit_log_event('INSECURE_FILE_PERMISSIONS', {
-                        'file': file_path,
-                        'permissions': permissions
-                    })
+            # Check if file is accessible by group or others
+            is_secure = not mode & (stat.S_IRWXG | stat.S_IRWXO)
+
+            results[file_path] = {
+                'permissions': permissions,
+                'is_secure': is_secure,
+                'owner_readable': bool(mode & stat.S_IRUSR),
+                'owner_writable': bool(mode & stat.S_IWUSR)
+            }
+
+            if not is_secure:
+                self.audit_log_event('INSECURE_FILE_PERMISSIONS', {
+                    'file': file_path,
+                    'permissions': permissions
+                })
 
         return results
 
     def generate_secure_password(self, length: int = 32) -> str:
         """Generate a cryptographically secure password"""
         alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
-        password = ''.join(secrets.choice(alphabet) for _ in range(length))
+        password = ''.join(_SYSTEM_RANDOM.choices(alphabet, k=length))
 
         self.audit_log_event('SECURE_PASSWORD_GENERATED', {'length': length})
         return password
 
+    def _pbkdf2(self, data: str, salt: bytes) -> bytes:
+        """PBKDF2-HMAC-SHA256 through OpenSSL's EVP interface"""
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=PBKDF2_LENGTH, salt=salt, iterations=PBKDF2_ITERATIONS)
+        return kdf.derive(data.encode())
+
     def hash_sensitive_data(self, data: str) -> str:
         """Hash sensitive data for storage"""
         salt = secrets.token_bytes(32)
-        hasher = hashlib.pbkdf2_hmac('sha256', data.encode(), salt, 100000)
-        return base64.b64encode(salt + hasher).decode()
+        hasher = self._pbkdf2(data, salt)
+        return (salt + hasher).hex()
 
-    def verify_hashed_data(self, data: str, hashed: str) -> bool:
-        """Verify hashed data"""
+    def _decode_hash(self, hashed: str) -> Tuple[bytes, bytes]:
+        """Split a stored hash into (salt, digest)"""
         try:
+            decoded = bytes.fromhex(hashed)
+        except ValueError:
+            # Hashes created before the switch to hex are base64
             decoded = base64.b64decode(hashed.encode())
-            salt = decoded[:32]
-            stored_hash = decoded[32:]
+        return decoded[:32], decoded[32:]
 
-            new_hash = hashlib.pbkdf2_hmac('sha256', data.encode(), salt, 100000)
+    def verify_hashed_data(self, data: str, hashed: str) -> bool:
+        """Verify hashed data"""
+        try:
+            salt, stored_hash = self._decode_hash(hashed)
+            new_hash = self._pbkdf2(data, salt)
             return secrets.compare_digest(stored_hash, new_hash)
         except Exception:
             return False
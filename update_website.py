@@ -4,19 +4,91 @@
 Update docs/index.html with real data from research system
 """
 
-import requests
+import asyncio
+import importlib.util
+import httpx
 import json
 import os
+import re
 from datetime import datetime
 from pathlib import Path
+from jinja2 import Environment
 
-def get_real_papers():
+OPENALEX_WORKS_URL = "https://api.openalex.org/works"
+HEADERS = {"User-Agent": "Compensation-Research-Bot/1.0"}
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Every stat placeholder in docs/index.html, matched in a single pass.
+# Compiled as bytes so the page is rewritten without decoding it.
+_UPDATE_RE = re.compile((
+    r'(?P<ts>마지막 업데이트: <strong>.*?</strong>)'
+    r'|(?P<papers>분석 논문:</div>\s*<div>\d+개)'
+    r'|(?P<docs>현재 \d+,?\d*개 문서)'
+    r'|(?P<new>새 논문: \d+개)'
+).encode('utf-8'))
+
+# Template for docs/real-data.html, compiled once; OpenAlex strings are HTML-escaped
+_REAL_DATA_TEMPLATE = Environment(autoescape=True).from_string('''<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>실제 보상작용 연구 데이터</title>
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 20px; }
+        .paper { border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 5px; }
+        .title { font-weight: bold; color: #0645ad; }
+        .meta { color: #666; font-size: 0.9em; }
+        .timestamp { background: #f0f0f0; padding: 10px; border-radius: 3px; margin-bottom: 20px; }
+    </style>
+</head>
+<body>
+    <h1>🔬 실제 보상작용 연구 데이터</h1>
+
+    <div class="timestamp">
+        <strong>마지막 업데이트:</strong> {{ timestamp }}<br>
+        <strong>실제 논문 수:</strong> {{ total }}개<br>
+        <strong>데이터 소스:</strong> OpenAlex API (실시간)
+    </div>
+
+    <h2>최신 보상작용 연구 논문들:</h2>
+{% for paper in papers %}
+    <div class="paper">
+        <div class="title">{{ loop.index }}. {{ paper.title }}</div>
+        <div class="meta">
+            📅 발행년도: {{ paper.year }} |
+            📊 인용수: {{ paper.citations }} |
+            📖 저널: {{ paper.journal }}
+        </div>
+    </div>{% endfor %}
+
+    <hr>
+    <p><em>이 데이터는 OpenAlex API에서 실시간으로 가져온 실제 연구논문 정보입니다.</em></p>
+    <p><a href="index.html">← 메인 위키로 돌아가기</a></p>
+
+</body>
+</html>''')
+
+async def _fetch_pages_async(params, n_pages):
+    """Fetch all result pages concurrently over one multiplexed HTTP/2 connection"""
+    async with httpx.AsyncClient(http2=_HTTP2, timeout=30, headers=HEADERS) as client:
+        responses = await asyncio.gather(*(
+            client.get(OPENALEX_WORKS_URL, params={**params, "page": page})
+            for page in range(1, n_pages + 1)
+        ))
+
+    papers = []
+    for response in responses:
+        response.raise_for_status()
+        papers.extend(response.json().get("results", []))
+    return papers
+
+def get_real_papers(n_pages=1):
     """Get real papers from OpenAlex API"""
     print("📡 Fetching real papers...")
 
-    api_base = "https://api.openalex.org/works"
-    headers = {"User-Agent": "Compensation-Research-Bot/1.0"}
-
     # Search for compensation-related papers
     query = "compensation AND (physical therapy OR physiotherapy OR biomechanics)"
 
@@ -37,22 +109,24 @@ def get_real_papers():
     }
 
     try:
-        response = requests.get(api_base, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        papers = data.get("results", [])
+        papers = asyncio.run(_fetch_pages_async(params, n_pages))
         print(f"✅ Found {len(papers)} real papers")
         return papers
     except Exception as e:
         print(f"❌ API Error: {e}")
         return []
 
-def update_index_html():
+def _journal_name(paper):
+    """Journal display name from a work's primary location"""
+    location = paper.get('primary_location', {})
+    if location and location.get('source'):
+        return location['source'].get('display_name', 'Unknown Journal')
+    return "Unknown Journal"
+
+def update_index_html(papers):
     """Update docs/index.html with real data"""
     print("🔄 Updating website with real data...")
 
-    papers = get_real_papers()
-
     if not papers:
         print("❌ No papers found, keeping existing content")
         return False
@@ -61,69 +135,27 @@ def update_index_html():
     now = datetime.now()
     timestamp = now.strftime("%Y년 %m월 %d일 %H:%M (UTC)")
 
-    # Create recent changes from real papers
-    recent_changes = ""
-    for i, paper in enumerate(papers[:5]):
-        title = paper.get('display_name', 'Unknown Title')[:80]
-        year = paper.get('publication_year', 'Unknown')
-        citations = paper.get('cited_by_count', 0)
-
-        # Get journal name
-        journal = "Unknown Journal"
-        location = paper.get('primary_location', {})
-        if location and location.get('source'):
-            journal = location['source'].get('display_name', 'Unknown Journal')
-
-        recent_changes += f'''
-        <div class="change-item">
-          <a href="#" class="change-title">{title}...</a>
-          <span class="bot-badge">봇</span><span class="new-badge">신규</span>
-          <div class="change-meta">
-            {timestamp} • 5WHY 분석 완료 • <a href="#" class="wiki-link">{journal}</a> 논문 기반 • 인용수: {citations}
-          </div>
-        </div>'''
-
     # Read current HTML
     html_path = Path("docs/index.html")
     if not html_path.exists():
         print(f"❌ {html_path} not found")
         return False
 
-    with open(html_path, 'r', encoding='utf-8') as f:
+    with open(html_path, 'rb') as f:
         html_content = f.read()
 
-    # Update timestamp
-    import re
-    html_content = re.sub(
-        r'마지막 업데이트: <strong>.*?</strong>',
-        f'마지막 업데이트: <strong>{timestamp}</strong>',
-        html_content
-    )
-
-    # Update paper count
-    html_content = re.sub(
-        r'분석 논문:</div>\s*<div>\d+개',
-        f'분석 논문:</div>\\n          <div>{len(papers)}개',
-        html_content
-    )
-
-    # Update document count
+    # Update timestamp, paper count, document count and new papers count
     total_docs = 1200 + len(papers)  # Base + new papers
-    html_content = re.sub(
-        r'현재 \d+,?\d*개 문서',
-        f'현재 {total_docs:,}개 문서',
-        html_content
-    )
-
-    # Update new papers count
-    html_content = re.sub(
-        r'새 논문: \d+개',
-        f'새 논문: {len(papers)}개',
-        html_content
-    )
+    replacements = {
+        "ts": f'마지막 업데이트: <strong>{timestamp}</strong>'.encode('utf-8'),
+        "papers": f'분석 논문:</div>\n          <div>{len(papers)}개'.encode('utf-8'),
+        "docs": f'현재 {total_docs:,}개 문서'.encode('utf-8'),
+        "new": f'새 논문: {len(papers)}개'.encode('utf-8'),
+    }
+    html_content = _UPDATE_RE.sub(lambda m: replacements[m.lastgroup], html_content)
 
     # Write updated HTML
-    with open(html_path, 'w', encoding='utf-8') as f:
+    with open(html_path, 'wb') as f:
         f.write(html_content)
 
     print(f"✅ Website updated with {len(papers)} real papers")
@@ -131,69 +163,23 @@ def update_index_html():
 
     return True
 
-def create_real_data_page():
+def create_real_data_page(papers):
     """Create a dedicated real data page"""
-    papers = get_real_papers()
-
     if not papers:
         return False
 
     timestamp = datetime.now().strftime("%Y년 %m월 %d일 %H:%M (UTC)")
 
-    html_content = f'''<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>실제 보상작용 연구 데이터</title>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 20px; }}
-        .paper {{ border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-        .title {{ font-weight: bold; color: #0645ad; }}
-        .meta {{ color: #666; font-size: 0.9em; }}
-        .timestamp {{ background: #f0f0f0; padding: 10px; border-radius: 3px; margin-bottom: 20px; }}
-    </style>
-</head>
-<body>
-    <h1>🔬 실제 보상작용 연구 데이터</h1>
-
-    <div class="timestamp">
-        <strong>마지막 업데이트:</strong> {timestamp}<br>
-        <strong>실제 논문 수:</strong> {len(papers)}개<br>
-        <strong>데이터 소스:</strong> OpenAlex API (실시간)
-    </div>
-
-    <h2>최신 보상작용 연구 논문들:</h2>
-'''
-
-    for i, paper in enumerate(papers, 1):
-        title = paper.get('display_name', 'Unknown Title')
-        year = paper.get('publication_year', 'Unknown')
-        citations = paper.get('cited_by_count', 0)
-
-        journal = "Unknown Journal"
-        location = paper.get('primary_location', {})
-        if location and location.get('source'):
-            journal = location['source'].get('display_name', 'Unknown Journal')
-
-        html_content += f'''
-    <div class="paper">
-        <div class="title">{i}. {title}</div>
-        <div class="meta">
-            📅 발행년도: {year} |
-            📊 인용수: {citations} |
-            📖 저널: {journal}
-        </div>
-    </div>'''
-
-    html_content += '''
-
-    <hr>
-    <p><em>이 데이터는 OpenAlex API에서 실시간으로 가져온 실제 연구논문 정보입니다.</em></p>
-    <p><a href="index.html">← 메인 위키로 돌아가기</a></p>
-
-</body>
-</html>'''
+    rows = [
+        {
+            "title": paper.get('display_name', 'Unknown Title'),
+            "year": paper.get('publication_year', 'Unknown'),
+            "citations": paper.get('cited_by_count', 0),
+            "journal": _journal_name(paper),
+        }
+        for paper in papers
+    ]
+    html_content = _REAL_DATA_TEMPLATE.render(papers=rows, timestamp=timestamp, total=len(papers))
 
     # Save to docs
     real_data_path = Path("docs/real-data.html")
@@ -207,11 +193,14 @@ if __name__ == "__main__":
     print("🚀 Website Update Started")
     print("=" * 50)
 
+    # Fetch once and share between both pages
+    papers = get_real_papers()
+
     # Update main website
-    main_success = update_index_html()
+    main_success = update_index_html(papers)
 
     # Create real data page
-    real_success = create_real_data_page()
+    real_success = create_real_data_page(papers)
 
     if main_success or real_success:
         print("\n✅ SUCCESS: Website updated with real data!")
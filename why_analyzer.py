@@ -10,11 +10,39 @@ Claude Development Rules 준수하여 개발
 4. 치료 우선순위 결정
 """
 
+import copy
 import re
+import threading
+from itertools import chain, islice
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# 이보다 짧은 초록은 numpy 배열 생성 비용이 정렬 이득보다 큼
+NUMPY_RESTORE_MIN_WORDS = 256
+
+# 논문 ID별로 보관하는 분석 결과 최대 개수
+ANALYSIS_CACHE_SIZE = 4096
+
+# hyperscan의 \w, \s는 ASCII 기준이므로 그 밖의 문자가 있으면 re와 결과가 달라질 수 있음
+_HYPERSCAN_UNSAFE = re.compile(r'[^\x00-\x1b\x20-\x7f]')
+
 class CompensationType(Enum):
     WEAKNESS = "weakness"
     OVERACTIVITY = "overactivity"
@@ -59,8 +87,22 @@ class FiveWhyAnalysis:
     key_message: str
     treatment_keypoints: List[str]
 
+@dataclass
+class _PaperCtx:
+    """논문 1편 분석 동안 공유하는 전처리 결과"""
+    text: str
+    text_lower: str
+    sentences: List[str]  # 원문 대소문자
+    sentences_lower: List[str]
+    sentence_starts: List[int]  # text_lower 기준 각 문장의 시작 오프셋
+    finding_hits: Optional[set] = None
+
 class CompensationWhyAnalyzer:
     def __init__(self):
+        # 논문 ID별 분석 결과 캐시 (삽입 순서로 오래된 항목부터 제거)
+        self._analysis_cache: Dict[Tuple[str, int], FiveWhyAnalysis] = {}
+        self._analysis_cache_lock = threading.Lock()
+
         # 5WHY 질문 템플릿
         self.why_questions = {
             1: "왜 이 통증/기능장애가 발생했는가?",
@@ -92,6 +134,14 @@ class CompensationWhyAnalyzer:
             }
         }
 
+        # 1차 키워드 -> (우선순위, 패턴 데이터) 역색인
+        # 우선순위는 (패턴 선언 순서, 패턴 내 키워드 순서)이므로 가장 작은 값이 기존 루프의 첫 일치와 같음
+        self._primary_index = {
+            keyword: ((pattern_rank, keyword_rank), pattern_data)
+            for pattern_rank, pattern_data in enumerate(self.compensation_patterns.values())
+            for keyword_rank, keyword in enumerate(pattern_data["primary"])
+        }
+
         # 임상적 의미 키워드
         self.clinical_keywords = {
             "diagnosis": ["differential diagnosis", "clinical presentation", "assessment"],
@@ -100,7 +150,312 @@ class CompensationWhyAnalyzer:
             "prevention": ["risk factor", "prevention", "screening", "early detection"]
         }
 
+        # WHY 단계별 발견사항 (라벨, 미리 컴파일한 정규식 목록)
+        # \w+로 시작하는 패턴은 \b로 고정해 단어 중간 위치에서의 역추적을 생략
+        self._level_patterns = {
+            1: [
+                # 1차 WHY: 관찰된 현상과 직접적 원인
+                # 통증 패턴
+                ("Observed", [
+                    re.compile(r"\b(\w+\s+pain)"),
+                    re.compile(r"pain in (\w+)"),
+                    re.compile(r"\b(\w+\s+discomfort)"),
+                    re.compile(r"\b(\w+\s+dysfunction)"),
+                    re.compile(r"dysfunction of (\w+)")
+                ]),
+                # 기능 제한
+                ("Functional limitation", [
+                    re.compile(r"reduced (\w+)"),
+                    re.compile(r"decreased (\w+)"),
+                    re.compile(r"impaired (\w+)"),
+                    re.compile(r"limited (\w+)"),
+                    re.compile(r"restricted (\w+)")
+                ])
+            ],
+            2: [
+                # 2차 WHY: 근육 불균형 패턴
+                # 약화된 근육
+                ("Weakness", [
+                    re.compile(r"\b(\w+\s+weakness)"),
+                    re.compile(r"weak (\w+)"),
+                    re.compile(r"\b(\w+\s+inhibition)"),
+                    re.compile(r"reduced (\w+\s+strength)"),
+                    re.compile(r"\b(\w+\s+atrophy)")
+                ]),
+                # 과활성 근육
+                ("Overactivity", [
+                    re.compile(r"\b(\w+\s+overactivity)"),
+                    re.compile(r"\b(\w+\s+dominance)"),
+                    re.compile(r"\b(\w+\s+tightness)"),
+                    re.compile(r"increased (\w+\s+activity)"),
+                    re.compile(r"\b(\w+\s+hyperactivity)")
+                ])
+            ],
+            3: [
+                # 3차 WHY: 근육 불균형의 원인
+                # 구조적 요인
+                ("Structural factor", [
+                    re.compile(r"\b(\w+\s+injury)"),
+                    re.compile(r"previous (\w+)"),
+                    re.compile(r"\b(\w+\s+trauma)"),
+                    re.compile(r"anatomical (\w+)"),
+                    re.compile(r"structural (\w+)")
+                ]),
+                # 기능적 요인
+                ("Functional factor", [
+                    re.compile(r"\b(\w+\s+posture)"),
+                    re.compile(r"repetitive (\w+)"),
+                    re.compile(r"prolonged (\w+)"),
+                    re.compile(r"habitual (\w+)"),
+                    re.compile(r"occupational (\w+)")
+                ])
+            ],
+            4: [
+                # 4차 WHY: 보상 패턴 형성 원인
+                # 신경계 적응
+                ("Neural adaptation", [
+                    re.compile(r"motor (\w+)"),
+                    re.compile(r"neural (\w+)"),
+                    re.compile(r"\b(\w+\s+adaptation)"),
+                    re.compile(r"central (\w+)"),
+                    re.compile(r"cortical (\w+)")
+                ]),
+                # 역학적 적응
+                ("Mechanical adaptation", [
+                    re.compile(r"mechanical (\w+)"),
+                    re.compile(r"biomechanical (\w+)"),
+                    re.compile(r"kinematic (\w+)"),
+                    re.compile(r"force (\w+)"),
+                    re.compile(r"load (\w+)")
+                ])
+            ],
+            5: [
+                # 5차 WHY: 보상 고착화 원인
+                # 학습된 패턴
+                ("Learned pattern", [
+                    re.compile(r"motor (\w+)"),
+                    re.compile(r"learned (\w+)"),
+                    re.compile(r"habitual (\w+)"),
+                    re.compile(r"automatic (\w+)"),
+                    re.compile(r"programmed (\w+)")
+                ]),
+                # 구조적 변화
+                ("Structural change", [
+                    re.compile(r"tissue (\w+)"),
+                    re.compile(r"fascial (\w+)"),
+                    re.compile(r"joint (\w+)"),
+                    re.compile(r"length (\w+)"),
+                    re.compile(r"stiffness (\w+)")
+                ])
+            ]
+        }
+
+        # 발견사항 정규식을 hyperscan DB 하나로 묶어 텍스트를 한 번만 스캔하고,
+        # 일치가 있는 패턴만 re로 다시 실행 (캡처와 매칭 순서는 re 그대로)
+        self._finding_ids = {}
+        for groups in self._level_patterns.values():
+            for _, patterns in groups:
+                for pattern in patterns:
+                    self._finding_ids.setdefault(pattern, len(self._finding_ids))
+        self._finding_db = self._build_pattern_db(list(self._finding_ids))
+        # hyperscan scratch는 동시에 한 스캔만 쓸 수 있으므로 스레드별로 따로 할당
+        self._hyperscan_local = threading.local()
+
+        # 문장 분리 정규식
+        self._sentence_split = re.compile(r'[.!?]+')
+
+        # 단계별 메커니즘 키워드
+        self.mechanism_keywords = {
+            1: ["acute", "onset", "initial", "primary"],
+            2: ["inhibition", "facilitation", "imbalance", "asymmetry"],
+            3: ["predisposing", "risk factor", "etiology", "cause"],
+            4: ["compensation", "adaptation", "strategy", "substitution"],
+            5: ["plasticity", "chronic", "persistent", "maladaptive"]
+        }
+
+        # 임상적 의미 문장 키워드
+        self.significance_keywords = [
+            "clinical", "therapeutic", "treatment", "intervention",
+            "rehabilitation", "management", "assessment", "diagnosis"
+        ]
+
+        # 키워드 집합별 Aho-Corasick 오토마톤 (텍스트를 한 번만 스캔)
+        self._mechanism_ac = {
+            level: self._build_automaton(keywords)
+            for level, keywords in self.mechanism_keywords.items()
+        }
+        self._significance_ac = self._build_automaton(self.significance_keywords)
+
+        # 키워드 -> 보상 유형/단계/가역성 (선언 순서가 우선순위, 먼저 나온 키워드가 이김)
+        self._type_map = {
+            "weakness": CompensationType.WEAKNESS,
+            "overactivity": CompensationType.OVERACTIVITY,
+            "dominance": CompensationType.OVERACTIVITY,
+            "substitution": CompensationType.SUBSTITUTION,
+            "adaptation": CompensationType.ADAPTATION
+        }
+        self._stage_map = {
+            "acute": CompensationStage.ACUTE,
+            "chronic": CompensationStage.CHRONIC
+        }
+        self._reversibility_map = {
+            "reversible": Reversibility.REVERSIBLE,
+            "recovery": Reversibility.REVERSIBLE,
+            "fixed": Reversibility.FIXED,
+            "permanent": Reversibility.FIXED
+        }
+        # 키워드 -> 치료 우선순위 (일치하는 항목 모두 순서대로)
+        self._treatment_map = {
+            "strengthening": "Strengthening weak muscles",
+            "stretching": "Stretching tight structures",
+            "motor control": "Motor control retraining"
+        }
+
+        # 보상 패턴 식별에 쓰는 고정 문자열 (1차 키워드 + 유형/단계/가역성/치료 키워드)
+        self.pattern_keywords = [
+            *self._primary_index,
+            *self._type_map, *self._stage_map, *self._reversibility_map, *self._treatment_map
+        ]
+        self._pattern_ac = self._build_automaton(self.pattern_keywords)
+
+        # 증거 강도 지표 (텍스트가 단계마다 같으므로 논문당 한 번만 스캔)
+        self.evidence_indicators = ["significant", "p <", "correlation", "association", "effect"]
+        self._evidence_ac = self._build_automaton(self.evidence_indicators)
+
+        # 치료법 추출 정규식
+        self._treatment_patterns = [
+            re.compile(r"treatment (?:with|using|include[ds]?) ([^.]+)"),
+            re.compile(r"intervention (?:with|using|include[ds]?) ([^.]+)"),
+            re.compile(r"therapy (?:with|using|include[ds]?) ([^.]+)")
+        ]
+
+    def _build_automaton(self, keywords: List[str]):
+        """키워드 Aho-Corasick 오토마톤 생성 (pyahocorasick이 없으면 None)"""
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_pattern_db(self, patterns: List[re.Pattern]):
+        """정규식 목록으로 hyperscan DB 생성 (hyperscan이 없으면 None)"""
+        if hyperscan is None:
+            return None
+
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+        )
+        return db
+
+    def _matching_patterns(self, db, text: str) -> Optional[set]:
+        """일치가 하나라도 있는 패턴 ID 집합 (판단할 수 없으면 None)"""
+        if db is None or _HYPERSCAN_UNSAFE.search(text):
+            return None
+
+        scratches = getattr(self._hyperscan_local, "scratches", None)
+        if scratches is None:
+            scratches = self._hyperscan_local.scratches = {}
+        scratch = scratches.get(id(db))
+        if scratch is None:
+            scratch = scratches[id(db)] = hyperscan.Scratch(db)
+
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+
+        db.scan(text.encode(), match_event_handler=on_match, scratch=scratch)
+        return hits
+
+    def _split_sentences(self, text: str) -> Tuple[List[int], List[str]]:
+        """문장 분리: (각 문장의 시작 오프셋, 문장 목록) - re.split과 같은 결과를 한 번의 스캔으로"""
+        starts = [0]
+        sentences = []
+        for match in self._sentence_split.finditer(text):
+            sentences.append(text[starts[-1]:match.start()])
+            starts.append(match.end())
+        sentences.append(text[starts[-1]:])
+        return starts, sentences
+
+    def _build_ctx(self, text: str) -> _PaperCtx:
+        """소문자 변환과 문장 분리를 논문당 한 번만 수행"""
+        text_lower = text.lower()
+        sentence_starts, sentences_lower = self._split_sentences(text_lower)
+
+        # ASCII는 소문자 변환 후에도 오프셋이 같으므로 경계를 재사용
+        if text.isascii():
+            sentences = [text[start:start + len(sentence)] for start, sentence in zip(sentence_starts, sentences_lower)]
+        else:
+            sentences = self._split_sentences(text)[1]
+
+        return _PaperCtx(
+            text=text,
+            text_lower=text_lower,
+            sentences=sentences,
+            sentences_lower=sentences_lower,
+            sentence_starts=sentence_starts,
+            finding_hits=self._matching_patterns(self._finding_db, text_lower)
+        )
+
+    def _find_keywords(self, automaton, keywords: List[str], text: str) -> set:
+        """텍스트에 등장하는 키워드 집합"""
+        if automaton is None:
+            return {keyword for keyword in keywords if keyword in text}
+        return {keyword for _, keyword in automaton.iter(text)}
+
+    def _lookup_first(self, mapping: Dict, hits: set, default):
+        """선언 순서상 처음으로 등장한 키워드의 값 (없으면 기본값)"""
+        return next((value for keyword, value in mapping.items() if keyword in hits), default)
+
+    def _keyword_sentences(self, automaton, keywords: List[str], ctx: _PaperCtx, limit: int) -> List[int]:
+        """키워드를 포함하는 문장 인덱스를 순서대로 최대 limit개 반환"""
+        if automaton is None:
+            matched = [
+                i for i, sentence in enumerate(ctx.sentences_lower)
+                if any(keyword in sentence for keyword in keywords)
+            ]
+            return matched[:limit]
+
+        # 히트는 끝 위치 순으로 나오므로 문장 인덱스도 오름차순
+        starts = ctx.sentence_starts
+        matched = []
+        for end, _ in automaton.iter(ctx.text_lower):
+            index = bisect_right(starts, end) - 1
+            if not matched or matched[-1] != index:
+                matched.append(index)
+                if len(matched) == limit:
+                    break
+        return matched
+
     def analyze_paper(self, paper_data: Dict) -> FiveWhyAnalysis:
+        """논문 데이터를 5WHY 분석 (같은 논문은 캐시된 결과 반환)"""
+        paper_id = paper_data.get("id")
+        if not paper_id:
+            return self._analyze_paper(paper_data)
+
+        # 나중에 본문이 추가된 논문은 다시 분석하도록 본문도 키에 포함
+        key = (paper_id, hash(paper_data.get("full_text", "")))
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(key)
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = self._analyze_paper(paper_data)
+        with self._analysis_cache_lock:
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                del self._analysis_cache[next(iter(self._analysis_cache))]
+            self._analysis_cache[key] = result
+        return copy.deepcopy(result)
+
+    def _analyze_paper(self, paper_data: Dict) -> FiveWhyAnalysis:
         """논문 데이터를 5WHY 분석"""
         title = paper_data.get("display_name", "")
         abstract = self._restore_abstract(paper_data.get("abstract_inverted_index", {}))
@@ -108,21 +463,22 @@ class CompensationWhyAnalyzer:
         # 추가 텍스트가 있다면 활용 (PDF 내용 등)
         full_text = paper_data.get("full_text", "")
         combined_text = f"{title}\n{abstract}\n{full_text}"
+        ctx = self._build_ctx(combined_text)
 
         # 5WHY 분석 수행
-        why_levels = self._perform_five_why_analysis(combined_text)
+        why_levels = self._perform_five_why_analysis(ctx)
 
         # 보상 패턴 식별
-        compensation_pattern = self._identify_compensation_pattern(combined_text)
+        compensation_pattern = self._identify_compensation_pattern(ctx)
 
         # 임상적 의미 추출
-        clinical_significance = self._extract_clinical_significance(combined_text)
+        clinical_significance = self._extract_clinical_significance(ctx)
 
         # 핵심 메시지 생성
         key_message = self._generate_key_message(why_levels, compensation_pattern)
 
         # 치료 키포인트 추출
-        treatment_keypoints = self._extract_treatment_keypoints(combined_text, compensation_pattern)
+        treatment_keypoints = self._extract_treatment_keypoints(ctx, compensation_pattern)
 
         return FiveWhyAnalysis(
             paper_title=title,
@@ -133,291 +489,91 @@ class CompensationWhyAnalyzer:
             treatment_keypoints=treatment_keypoints
         )
 
-    def _perform_five_why_analysis(self, text: str) -> List[WhyLevel]:
+    def _perform_five_why_analysis(self, ctx: _PaperCtx) -> List[WhyLevel]:
         """5단계 WHY 분석 수행"""
         why_levels = []
-        text_lower = text.lower()
-
-        # 1차 WHY: 왜 이 통증/기능장애가 발생했는가?
-        level1_findings = self._extract_level1_findings(text_lower)
-        level1_mechanisms = self._extract_level1_mechanisms(text_lower)
-        why_levels.append(WhyLevel(
-            level=1,
-            question=self.why_questions[1],
-            findings=level1_findings,
-            mechanisms=level1_mechanisms,
-            evidence_strength=self._calculate_evidence_strength(level1_findings, text_lower)
-        ))
-
-        # 2차 WHY: 왜 특정 근육이 약화/과활성화되었는가?
-        level2_findings = self._extract_level2_findings(text_lower)
-        level2_mechanisms = self._extract_level2_mechanisms(text_lower)
-        why_levels.append(WhyLevel(
-            level=2,
-            question=self.why_questions[2],
-            findings=level2_findings,
-            mechanisms=level2_mechanisms,
-            evidence_strength=self._calculate_evidence_strength(level2_findings, text_lower)
-        ))
-
-        # 3차 WHY: 왜 근육 불균형이 생겼는가?
-        level3_findings = self._extract_level3_findings(text_lower)
-        level3_mechanisms = self._extract_level3_mechanisms(text_lower)
-        why_levels.append(WhyLevel(
-            level=3,
-            question=self.why_questions[3],
-            findings=level3_findings,
-            mechanisms=level3_mechanisms,
-            evidence_strength=self._calculate_evidence_strength(level3_findings, text_lower)
-        ))
-
-        # 4차 WHY: 왜 보상 패턴이 형성되었는가?
-        level4_findings = self._extract_level4_findings(text_lower)
-        level4_mechanisms = self._extract_level4_mechanisms(text_lower)
-        why_levels.append(WhyLevel(
-            level=4,
-            question=self.why_questions[4],
-            findings=level4_findings,
-            mechanisms=level4_mechanisms,
-            evidence_strength=self._calculate_evidence_strength(level4_findings, text_lower)
-        ))
-
-        # 5차 WHY: 왜 이 보상이 고착화되었는가?
-        level5_findings = self._extract_level5_findings(text_lower)
-        level5_mechanisms = self._extract_level5_mechanisms(text_lower)
-        why_levels.append(WhyLevel(
-            level=5,
-            question=self.why_questions[5],
-            findings=level5_findings,
-            mechanisms=level5_mechanisms,
-            evidence_strength=self._calculate_evidence_strength(level5_findings, text_lower)
-        ))
+        evidence_score = self._evidence_score(ctx)
+
+        for level, question in self.why_questions.items():
+            findings = self._extract_findings(ctx, level)
+            why_levels.append(WhyLevel(
+                level=level,
+                question=question,
+                findings=findings,
+                mechanisms=self._extract_mechanisms(ctx, level),
+                evidence_strength=self._calculate_evidence_strength(findings, evidence_score)
+            ))
 
         return why_levels
 
-    def _extract_level1_findings(self, text: str) -> List[str]:
-        """1차 WHY: 관찰된 현상과 직접적 원인"""
+    def _extract_findings(self, ctx: _PaperCtx, level: int) -> List[str]:
+        """WHY 단계별 발견사항 추출 (라벨 그룹 순서대로)"""
         findings = []
 
-        # 통증 패턴
-        pain_patterns = [
-            r"(\w+\s+pain)", r"pain in (\w+)", r"(\w+\s+discomfort)",
-            r"(\w+\s+dysfunction)", r"dysfunction of (\w+)"
-        ]
-
-        for pattern in pain_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Observed: {match}" for match in matches if match])
-
-        # 기능 제한
-        function_patterns = [
-            r"reduced (\w+)", r"decreased (\w+)", r"impaired (\w+)",
-            r"limited (\w+)", r"restricted (\w+)"
-        ]
-
-        for pattern in function_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Functional limitation: {match}" for match in matches if match])
-
-        return findings[:5]  # 상위 5개만
-
-    def _extract_level2_findings(self, text: str) -> List[str]:
-        """2차 WHY: 근육 불균형 패턴"""
-        findings = []
-
-        # 약화된 근육
-        weakness_patterns = [
-            r"(\w+\s+weakness)", r"weak (\w+)", r"(\w+\s+inhibition)",
-            r"reduced (\w+\s+strength)", r"(\w+\s+atrophy)"
-        ]
-
-        for pattern in weakness_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Weakness: {match}" for match in matches if match])
-
-        # 과활성 근육
-        overactivity_patterns = [
-            r"(\w+\s+overactivity)", r"(\w+\s+dominance)", r"(\w+\s+tightness)",
-            r"increased (\w+\s+activity)", r"(\w+\s+hyperactivity)"
-        ]
-
-        for pattern in overactivity_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Overactivity: {match}" for match in matches if match])
-
-        return findings[:5]
-
-    def _extract_level3_findings(self, text: str) -> List[str]:
-        """3차 WHY: 근육 불균형의 원인"""
-        findings = []
-
-        # 구조적 요인
-        structural_patterns = [
-            r"(\w+\s+injury)", r"previous (\w+)", r"(\w+\s+trauma)",
-            r"anatomical (\w+)", r"structural (\w+)"
-        ]
-
-        for pattern in structural_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Structural factor: {match}" for match in matches if match])
-
-        # 기능적 요인
-        functional_patterns = [
-            r"(\w+\s+posture)", r"repetitive (\w+)", r"prolonged (\w+)",
-            r"habitual (\w+)", r"occupational (\w+)"
-        ]
-
-        for pattern in functional_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Functional factor: {match}" for match in matches if match])
-
-        return findings[:5]
-
-    def _extract_level4_findings(self, text: str) -> List[str]:
-        """4차 WHY: 보상 패턴 형성 원인"""
-        findings = []
-
-        # 신경계 적응
-        neural_patterns = [
-            r"motor (\w+)", r"neural (\w+)", r"(\w+\s+adaptation)",
-            r"central (\w+)", r"cortical (\w+)"
-        ]
-
-        for pattern in neural_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Neural adaptation: {match}" for match in matches if match])
-
-        # 역학적 적응
-        mechanical_patterns = [
-            r"mechanical (\w+)", r"biomechanical (\w+)", r"kinematic (\w+)",
-            r"force (\w+)", r"load (\w+)"
-        ]
-
-        for pattern in mechanical_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Mechanical adaptation: {match}" for match in matches if match])
-
-        return findings[:5]
-
-    def _extract_level5_findings(self, text: str) -> List[str]:
-        """5차 WHY: 보상 고착화 원인"""
-        findings = []
-
-        # 학습된 패턴
-        learning_patterns = [
-            r"motor (\w+)", r"learned (\w+)", r"habitual (\w+)",
-            r"automatic (\w+)", r"programmed (\w+)"
-        ]
-
-        for pattern in learning_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Learned pattern: {match}" for match in matches if match])
-
-        # 구조적 변화
-        structural_change_patterns = [
-            r"tissue (\w+)", r"fascial (\w+)", r"joint (\w+)",
-            r"length (\w+)", r"stiffness (\w+)"
-        ]
-
-        for pattern in structural_change_patterns:
-            matches = re.findall(pattern, text)
-            findings.extend([f"Structural change: {match}" for match in matches if match])
-
-        return findings[:5]
-
-    def _extract_level1_mechanisms(self, text: str) -> List[str]:
-        return self._extract_mechanisms(text, ["acute", "onset", "initial", "primary"])
-
-    def _extract_level2_mechanisms(self, text: str) -> List[str]:
-        return self._extract_mechanisms(text, ["inhibition", "facilitation", "imbalance", "asymmetry"])
-
-    def _extract_level3_mechanisms(self, text: str) -> List[str]:
-        return self._extract_mechanisms(text, ["predisposing", "risk factor", "etiology", "cause"])
-
-    def _extract_level4_mechanisms(self, text: str) -> List[str]:
-        return self._extract_mechanisms(text, ["compensation", "adaptation", "strategy", "substitution"])
-
-    def _extract_level5_mechanisms(self, text: str) -> List[str]:
-        return self._extract_mechanisms(text, ["plasticity", "chronic", "persistent", "maladaptive"])
-
-    def _extract_mechanisms(self, text: str, keywords: List[str]) -> List[str]:
+        # 결과는 패턴 순서대로 이어 붙이므로 5개가 모이면 나머지 스캔은 생략
+        hits = ctx.finding_hits
+        for label, patterns in self._level_patterns[level]:
+            for pattern in patterns:
+                if hits is not None and self._finding_ids[pattern] not in hits:
+                    continue
+                for match in pattern.finditer(ctx.text_lower):
+                    if match.group(1):
+                        findings.append(f"{label}: {match.group(1)}")
+                        if len(findings) == 5:  # 상위 5개만
+                            return findings
+
+        return findings
+
+    def _extract_mechanisms(self, ctx: _PaperCtx, level: int) -> List[str]:
         """키워드 기반 메커니즘 추출"""
-        mechanisms = []
-        sentences = re.split(r'[.!?]+', text)
-
-        for sentence in sentences:
-            for keyword in keywords:
-                if keyword in sentence.lower():
-                    mechanisms.append(sentence.strip())
-                    break
+        matched = self._keyword_sentences(
+            self._mechanism_ac[level], self.mechanism_keywords[level], ctx, 3
+        )
+        return [ctx.sentences_lower[i].strip() for i in matched]  # 상위 3개만
 
-        return mechanisms[:3]  # 상위 3개만
+    def _evidence_score(self, ctx: _PaperCtx) -> float:
+        """텍스트에 등장한 증거 지표 비율"""
+        hits = self._find_keywords(self._evidence_ac, self.evidence_indicators, ctx.text_lower)
+        return min(len(hits) / len(self.evidence_indicators), 1.0)
 
-    def _calculate_evidence_strength(self, findings: List[str], text: str) -> float:
+    def _calculate_evidence_strength(self, findings: List[str], evidence_score: float) -> float:
         """증거 강도 계산"""
         if not findings:
             return 0.0
 
-        evidence_indicators = ["significant", "p <", "correlation", "association", "effect"]
-        evidence_count = sum(1 for indicator in evidence_indicators if indicator in text)
-
-        return min(evidence_count / len(evidence_indicators), 1.0)
+        return evidence_score
 
-    def _identify_compensation_pattern(self, text: str) -> CompensationPattern:
+    def _identify_compensation_pattern(self, ctx: _PaperCtx) -> CompensationPattern:
         """보상 패턴 식별"""
-        text_lower = text.lower()
+        # 고정 문자열은 한 번의 스캔으로 모두 찾아두고 집합 조회로 분기
+        hits = self._find_keywords(self._pattern_ac, self.pattern_keywords, ctx.text_lower)
 
         # 기본값
         primary_dysfunction = "Unknown dysfunction"
         compensatory_muscles = []
         affected_joints = []
-        compensation_type = CompensationType.SUBSTITUTION
-        stage = CompensationStage.CHRONIC
-        reversibility = Reversibility.PARTIALLY_REVERSIBLE
         clinical_tests = []
-        treatment_priority = []
-
-        # 알려진 패턴과 매칭
-        for pattern_name, pattern_data in self.compensation_patterns.items():
-            for primary_keyword in pattern_data["primary"]:
-                if primary_keyword in text_lower:
-                    primary_dysfunction = primary_keyword.title()
-                    compensatory_muscles = pattern_data["compensatory"]
-                    affected_joints = pattern_data["joints"]
-                    clinical_tests = pattern_data["tests"]
-                    break
-
-        # 보상 유형 결정
-        if "weakness" in text_lower:
-            compensation_type = CompensationType.WEAKNESS
-        elif "overactivity" in text_lower or "dominance" in text_lower:
-            compensation_type = CompensationType.OVERACTIVITY
-        elif "substitution" in text_lower:
-            compensation_type = CompensationType.SUBSTITUTION
-        elif "adaptation" in text_lower:
-            compensation_type = CompensationType.ADAPTATION
-
-        # 단계 결정
-        if "acute" in text_lower:
-            stage = CompensationStage.ACUTE
-        elif "chronic" in text_lower:
-            stage = CompensationStage.CHRONIC
-        else:
-            stage = CompensationStage.COMPENSATED
 
-        # 가역성 결정
-        if "reversible" in text_lower or "recovery" in text_lower:
-            reversibility = Reversibility.REVERSIBLE
-        elif "fixed" in text_lower or "permanent" in text_lower:
-            reversibility = Reversibility.FIXED
+        # 알려진 패턴과 매칭 (역색인에서 우선순위가 가장 높은 1차 키워드)
+        primary_keyword = min(
+            (kw for kw in hits if kw in self._primary_index),
+            key=lambda kw: self._primary_index[kw][0],
+            default=None
+        )
+        if primary_keyword:
+            pattern_data = self._primary_index[primary_keyword][1]
+            primary_dysfunction = primary_keyword.title()
+            compensatory_muscles = pattern_data["compensatory"]
+            affected_joints = pattern_data["joints"]
+            clinical_tests = pattern_data["tests"]
+
+        # 보상 유형, 단계, 가역성 결정
+        compensation_type = self._lookup_first(self._type_map, hits, CompensationType.SUBSTITUTION)
+        stage = self._lookup_first(self._stage_map, hits, CompensationStage.COMPENSATED)
+        reversibility = self._lookup_first(self._reversibility_map, hits, Reversibility.PARTIALLY_REVERSIBLE)
 
         # 치료 우선순위
-        if "strengthening" in text_lower:
-            treatment_priority.append("Strengthening weak muscles")
-        if "stretching" in text_lower:
-            treatment_priority.append("Stretching tight structures")
-        if "motor control" in text_lower:
-            treatment_priority.append("Motor control retraining")
+        treatment_priority = [priority for keyword, priority in self._treatment_map.items() if keyword in hits]
 
         return CompensationPattern(
             primary_dysfunction=primary_dysfunction,
@@ -430,22 +586,13 @@ class CompensationWhyAnalyzer:
             treatment_priority=treatment_priority
         )
 
-    def _extract_clinical_significance(self, text: str) -> str:
+    def _extract_clinical_significance(self, ctx: _PaperCtx) -> str:
         """임상적 의미 추출"""
-        significance_sentences = []
-        sentences = re.split(r'[.!?]+', text)
+        matched = self._keyword_sentences(self._significance_ac, self.significance_keywords, ctx, 2)
 
-        significance_keywords = [
-            "clinical", "therapeutic", "treatment", "intervention",
-            "rehabilitation", "management", "assessment", "diagnosis"
-        ]
-
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in significance_keywords):
-                significance_sentences.append(sentence.strip())
-
-        if significance_sentences:
-            return ". ".join(significance_sentences[:2])  # 상위 2개 문장
+        if matched:
+            # 소문자 문장에서 찾고, 결과는 원문 문장으로 반환
+            return ". ".join(ctx.sentences[i].strip() for i in matched)  # 상위 2개 문장
         return "Clinical significance not clearly identified."
 
     def _generate_key_message(self, why_levels: List[WhyLevel], pattern: CompensationPattern) -> str:
@@ -461,7 +608,7 @@ class CompensationWhyAnalyzer:
 
         return "Compensation mechanism requires further analysis."
 
-    def _extract_treatment_keypoints(self, text: str, pattern: CompensationPattern) -> List[str]:
+    def _extract_treatment_keypoints(self, ctx: _PaperCtx, pattern: CompensationPattern) -> List[str]:
         """치료 키포인트 추출"""
         keypoints = []
 
@@ -469,16 +616,10 @@ class CompensationWhyAnalyzer:
         if pattern.treatment_priority:
             keypoints.extend(pattern.treatment_priority[:2])
 
-        # 텍스트에서 치료법 추출
-        treatment_patterns = [
-            r"treatment (?:with|using|include[ds]?) ([^.]+)",
-            r"intervention (?:with|using|include[ds]?) ([^.]+)",
-            r"therapy (?:with|using|include[ds]?) ([^.]+)"
-        ]
-
-        for pattern in treatment_patterns:
-            matches = re.findall(pattern, text.lower())
-            keypoints.extend(matches[:2])
+        # 텍스트에서 치료법 추출 (pattern 인자를 가리지 않도록 별도 변수명 사용)
+        for treatment_re in self._treatment_patterns:
+            matches = islice(treatment_re.finditer(ctx.text_lower), 2)
+            keypoints.extend(match.group(1) for match in matches)
 
         return keypoints[:3]  # 상위 3개
 
@@ -487,6 +628,14 @@ class CompensationWhyAnalyzer:
         if not inverted_index:
             return ""
 
+        # 긴 초록은 단어별 등장 횟수만큼 단어를 반복하고 위치 배열을 한 번에 argsort
+        counts = [len(positions) for positions in inverted_index.values()]
+        total = sum(counts)
+        if np is not None and total >= NUMPY_RESTORE_MIN_WORDS:
+            positions = np.fromiter(chain.from_iterable(inverted_index.values()), dtype=np.int64, count=total)
+            words = np.repeat(np.array(list(inverted_index), dtype=object), counts)
+            return " ".join(words[np.argsort(positions, kind="stable")])
+
         word_positions = []
         for word, positions in inverted_index.items():
             for pos in positions: